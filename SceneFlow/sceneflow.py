@@ -1,8 +1,12 @@
 # sceneflow.py (v1.0)
 
 import bpy
-# import json # No longer using json string for state
-from bpy.props import StringProperty, BoolProperty, CollectionProperty, IntProperty, PointerProperty
+import os
+import csv
+import json
+import hashlib
+from bpy.props import StringProperty, BoolProperty, CollectionProperty, IntProperty, FloatProperty, EnumProperty, PointerProperty
+from bpy.app.handlers import persistent
 from bpy_extras.io_utils import ImportHelper, ExportHelper
 
 # --- Property Groups ---
@@ -40,11 +44,101 @@ class SceneFlowAddonPreferences(bpy.types.AddonPreferences):
         default="",
         subtype='FILE_PATH'
     )
+    enable_list_watch: BoolProperty(
+        name="Watch List File",
+        default=False,
+        description="Poll the last export path and apply added/removed names to the list when the file changes on disk"
+    )
+    list_watch_interval: FloatProperty(
+        name="Watch Interval",
+        default=1.0, min=0.1, max=60.0, subtype='TIME', unit='TIME',
+        description="Seconds between checks of the watched list file"
+    )
+    list_watch_reapply_isolate: BoolProperty(
+        name="Reapply Isolate on Change",
+        default=True,
+        description="While the list is isolated, show added objects and hide removed ones when the watched file changes"
+    )
+    enable_report_on_save: BoolProperty(
+        name="Write List Report on Save",
+        default=False,
+        description="Write a JSON list-health report next to the .blend file every time it is saved"
+    )
 
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "enable_auto_export")
         layout.prop(self, "last_export_path")
+        layout.prop(self, "enable_list_watch")
+        col = layout.column(); col.active = self.enable_list_watch
+        col.prop(self, "list_watch_interval")
+        col.prop(self, "list_watch_reapply_isolate")
+        layout.prop(self, "enable_report_on_save")
+
+# --- List Storage ---
+
+SMALL_LIST_EDIT = 32 # Up to this many changed entries, edit the collection in place instead of rebuilding it
+
+def get_list_names(scene):
+    """All list names in order, read in one call through the collection's name keys."""
+    return scene.ovm_object_name_list.keys()
+
+def _list_storage(scene):
+    # Blender 5.0+ keeps add-on defined properties apart from custom properties
+    getter = getattr(scene, "bl_system_properties_get", None)
+    return getter(do_create=True) if getter else scene
+
+def set_list_names(scene, names):
+    """Replace the whole list in one step, for bulk replacements.
+    The collection is rebuilt from a single ID property assignment instead of one add() plus one
+    .name write per entry (foreach_set cannot write strings). Returns the new length."""
+    names = list(names)
+    if names: _list_storage(scene)["ovm_object_name_list"] = [{"name": name} for name in names]
+    else: scene.ovm_object_name_list.clear()
+    _list_index_cache['key'] = None
+    current_len = len(names)
+    set_active_list_index(scene, min(scene.ovm_active_object_name_index, current_len - 1) if current_len > 0 else -1)
+    return current_len
+
+def add_list_items(scene, names):
+    """Append names in place with add(), keeping the name->index cache current. For small edits."""
+    name_list = scene.ovm_object_name_list; cache = _list_index_cache
+    cache_valid = cache['key'] == (scene.name, len(name_list))
+    for name in names:
+        item = name_list.add(); item.name = name
+        if cache_valid: cache['index'].setdefault(name, len(name_list) - 1)
+    if cache_valid: cache['key'] = (scene.name, len(name_list))
+
+def remove_list_indices(scene, indices):
+    """Remove entries in place, highest index first. For small edits."""
+    name_list = scene.ovm_object_name_list
+    for i in sorted(indices, reverse=True): name_list.remove(i)
+    _list_index_cache['key'] = None
+    current_len = len(name_list)
+    set_active_list_index(scene, min(scene.ovm_active_object_name_index, current_len - 1) if current_len > 0 else -1)
+
+def extend_list_names(scene, names):
+    """Append names (no duplicate check), in place for small edits and by rebuild otherwise."""
+    names = list(names)
+    if len(names) <= SMALL_LIST_EDIT: add_list_items(scene, names)
+    else: set_list_names(scene, get_list_names(scene) + names)
+
+def append_list_names(scene, names):
+    """Append names that are not in the list yet, keeping their order. Returns the appended names."""
+    seen = set(get_list_names(scene))
+    added = [name for name in dict.fromkeys(names) if name not in seen]
+    if added: extend_list_names(scene, added)
+    return added
+
+def remove_list_names(scene, names):
+    """Drop every entry whose name is in names (a set). Returns the removed count."""
+    current_names = get_list_names(scene)
+    indices = [i for i, name in enumerate(current_names) if name in names]
+    if not indices: return 0
+    if len(indices) <= SMALL_LIST_EDIT: remove_list_indices(scene, indices)
+    else: set_list_names(scene, [name for name in current_names if name not in names])
+    return len(indices)
+
 
 # --- Utility Functions ---
 
@@ -55,11 +149,91 @@ def auto_export_list_names(context):
     path = prefs.last_export_path
     if not path: return
     try:
-        names = [item.name for item in context.scene.ovm_object_name_list]
+        names = get_list_names(context.scene)
         with open(path, 'w', encoding='utf-8') as file: file.write("\n".join(names))
+        sync_list_watch(bpy.path.abspath(path)) # Our own write must not trigger the watcher
     except Exception as e: print(f"SceneFlow Auto-export failed: {e}")
 
 
+# --- List File Watcher ---
+
+# Last seen state of the watched file; names keep file order for appends.
+_list_watch_state = {'path': "", 'mtime': None, 'size': None, 'digest': None, 'names': ()}
+LIST_WATCH_IDLE_INTERVAL = 2.0 # Poll rate while watching is disabled (pref check only)
+
+def read_list_file(path):
+    """Return (sha1 digest, ordered unique names) for a list file."""
+    with open(path, 'rb') as f: data = f.read()
+    lines = (line.strip() for line in data.decode('utf-8', errors='replace').splitlines())
+    return hashlib.sha1(data).hexdigest(), tuple(dict.fromkeys(name for name in lines if name))
+
+def sync_list_watch(path):
+    """Take the current file contents as the watcher baseline without applying anything."""
+    state = _list_watch_state
+    try:
+        st = os.stat(path); digest, names = read_list_file(path)
+    except OSError:
+        st = None; digest = None; names = ()
+    state['path'] = path; state['digest'] = digest; state['names'] = names
+    state['mtime'] = st.st_mtime_ns if st else None; state['size'] = st.st_size if st else None
+
+def apply_list_name_diff(scene, added, removed, reapply_isolate=False):
+    """Apply only the added/removed names to the list. Returns (added_count, removed_count)."""
+    removed_names = {name for name in get_list_names(scene) if name in removed} # Only names that were in the list
+    removed_count = remove_list_names(scene, removed_names) if removed_names else 0
+    added_names = append_list_names(scene, added)
+    if reapply_isolate and scene.ovm_isolate_list_state and (added_names or removed_names):
+        # Touch only the affected objects, the rest of the isolation is unchanged
+        object_index = get_object_index()
+        for names, hide in ((added_names, False), (removed_names, True)):
+            for name in names:
+                obj = object_index.get(name)
+                if not obj: continue
+                try:
+                    if obj.hide_get() != hide: obj.hide_set(hide)
+                except RuntimeError: pass # Not in this view layer (other scene or excluded collection)
+    return len(added_names), removed_count
+
+def tag_sceneflow_redraw():
+    wm = bpy.context.window_manager
+    if not wm: return
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D': area.tag_redraw()
+
+def list_watch_timer():
+    """bpy.app.timers callback. Only stats the file unless mtime/size changed."""
+    prefs = get_addon_preferences()
+    if not prefs or not prefs.enable_list_watch: return LIST_WATCH_IDLE_INTERVAL
+    interval = prefs.list_watch_interval
+    if not prefs.last_export_path: return interval
+    path = bpy.path.abspath(prefs.last_export_path)
+    state = _list_watch_state
+    if state['path'] != path: sync_list_watch(path); return interval # New file: baseline only
+    try: st = os.stat(path)
+    except OSError: return interval
+    if st.st_mtime_ns == state['mtime'] and st.st_size == state['size']: return interval
+    try: digest, names = read_list_file(path)
+    except OSError as e: print(f"SceneFlow List watch failed: {e}"); return interval
+    state['mtime'] = st.st_mtime_ns; state['size'] = st.st_size
+    if digest == state['digest']: return interval # Touched but unchanged
+    old_names = set(state['names']); new_names = set(names)
+    added = [name for name in names if name not in old_names]
+    removed = old_names - new_names
+    state['digest'] = digest; state['names'] = names
+    scene = bpy.context.scene
+    if scene and (added or removed):
+        try:
+            added_count, removed_count = apply_list_name_diff(scene, added, removed, prefs.list_watch_reapply_isolate)
+            print(f"SceneFlow List watch: +{added_count} / -{removed_count} names from {path}")
+        except Exception as e: print(f"SceneFlow List watch: applying changes failed: {e}") # A raising timer gets unregistered
+        # Timers are outside the operator undo system; without a push the next undo would silently revert this
+        try: bpy.ops.ed.undo_push(message="SceneFlow: Apply List File Changes")
+        except RuntimeError as e: print(f"SceneFlow List watch: undo push failed: {e}")
+        tag_sceneflow_redraw()
+    return interval
+
+
 def get_object_visibility(obj):
     return {
         'name': obj.name, 'hidden': obj.hide_get(),
@@ -102,6 +276,286 @@ def restore_visibility_state(context, state_prop_name):
     return True
 
 
+# --- Live Selection Sync ---
+
+_selection_sync_owner = object() # msgbus subscription owner
+_selection_sync_state = {'selected': set(), 'updating': False}
+_list_index_cache = {'key': None, 'index': {}}
+
+def find_list_index(scene, name):
+    """Name -> list index via a cached map, validated on hit and rebuilt when the list changes."""
+    name_list = scene.ovm_object_name_list
+    cache = _list_index_cache; key = (scene.name, len(name_list))
+    if cache['key'] == key:
+        idx = cache['index'].get(name)
+        if idx is None or name_list[idx].name == name: return idx
+    cache['index'] = {name: i for i, name in enumerate(get_list_names(scene))}; cache['key'] = key
+    return cache['index'].get(name)
+
+def set_active_list_index(scene, idx):
+    """Programmatic index write, done under the sync guard so only UI list clicks drive the viewport selection."""
+    if idx == scene.ovm_active_object_name_index: return
+    state = _selection_sync_state; was_updating = state['updating']
+    state['updating'] = True
+    try: scene.ovm_active_object_name_index = idx
+    finally: state['updating'] = was_updating
+
+def seed_selection_sync(context):
+    _selection_sync_state['selected'] = {obj.name for obj in context.selected_objects}
+
+def on_viewport_selection_changed():
+    """msgbus/depsgraph callback. Diffs against the last seen selection and applies only the changed names."""
+    state = _selection_sync_state
+    if state['updating']: return
+    context = bpy.context; scene = context.scene
+    if not scene or not scene.ovm_selection_sync or not context.view_layer: return
+    selected = {obj.name for obj in context.selected_objects}
+    newly_selected = selected - state['selected']; deselected = state['selected'] - selected
+    state['selected'] = selected
+    mode = scene.ovm_selection_sync_membership
+    state['updating'] = True
+    try:
+        names_to_add = [name for name in sorted(newly_selected) if find_list_index(scene, name) is None] if mode in {'ADD', 'MIRROR'} else []
+        indices_to_remove = [i for i in (find_list_index(scene, name) for name in deselected) if i is not None] if mode == 'MIRROR' else []
+        if len(indices_to_remove) > SMALL_LIST_EDIT: remove_list_names(scene, deselected)
+        elif indices_to_remove: remove_list_indices(scene, indices_to_remove)
+        if names_to_add: extend_list_names(scene, names_to_add)
+        active = context.view_layer.objects.active
+        idx = find_list_index(scene, active.name) if active and active.name in selected else None
+        if idx is not None: set_active_list_index(scene, idx)
+    finally:
+        state['updating'] = False
+
+def on_active_list_index_changed(self, context):
+    """List click -> viewport selection. Only the previous selection is touched, no select_all."""
+    state = _selection_sync_state
+    if state['updating'] or not self.ovm_selection_sync: return
+    idx = self.ovm_active_object_name_index
+    if not 0 <= idx < len(self.ovm_object_name_list): return
+    obj = context.view_layer.objects.get(self.ovm_object_name_list[idx].name)
+    if not obj: return
+    state['updating'] = True
+    try:
+        for other in context.selected_objects:
+            if other != obj: other.select_set(False)
+        obj.select_set(True); context.view_layer.objects.active = obj
+        state['selected'] = {obj.name}
+    finally:
+        state['updating'] = False
+
+def on_selection_sync_toggled(self, context):
+    if self.ovm_selection_sync: seed_selection_sync(context)
+
+def subscribe_selection_sync():
+    bpy.msgbus.clear_by_owner(_selection_sync_owner)
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.LayerObjects, "active"), owner=_selection_sync_owner, args=(),
+        notify=on_viewport_selection_changed, options={'PERSISTENT'})
+
+@persistent
+def selection_sync_depsgraph_update(scene, depsgraph):
+    # Selection changes tag the scene; box select, select all/none never touch LayerObjects.active
+    if scene.ovm_selection_sync and depsgraph.id_type_updated('SCENE'): on_viewport_selection_changed()
+
+@persistent
+def selection_sync_load_post(dummy):
+    # msgbus subscriptions are dropped when a file is loaded
+    subscribe_selection_sync()
+    _list_index_cache['key'] = None
+    seed_selection_sync(bpy.context)
+
+@persistent
+def selection_sync_undo_post(dummy):
+    # Undo/redo can swap list contents without changing its length, and restores the old selection
+    _list_index_cache['key'] = None
+    seed_selection_sync(bpy.context)
+
+
+# --- Bulk Keyframing ---
+
+def ensure_object_fcurve(obj, data_path):
+    """F-curve for data_path on obj, creating the action (and slot/channelbag on slotted actions) as needed."""
+    anim = obj.animation_data or obj.animation_data_create()
+    if not anim.action: anim.action = bpy.data.actions.new(name=f"{obj.name}Action")
+    action = anim.action
+    if hasattr(action, "fcurve_ensure_for_datablock"): # Slotted actions (Blender 4.4+): slot, channelbag and F-curve in one C call
+        return action.fcurve_ensure_for_datablock(obj, data_path)
+    return action.fcurves.find(data_path) or action.fcurves.new(data_path)
+
+def key_object_flag(objects, data_path, value, frame_start, frame_end=None, frame_current=None):
+    """Key a boolean flag on each object at frame_start. With frame_end, keys inside the range are dropped
+    and each object's own previous value is keyed at frame_start - 1 and frame_end + 1.
+    Keys are merged with existing ones and written per F-curve with keyframe_points.add + foreach_set
+    instead of one keyframe_insert per object and frame. Returns the number of keyed objects."""
+    count = 0
+    for obj in objects:
+        fcurve = ensure_object_fcurve(obj, data_path)
+        points = fcurve.keyframe_points
+        old_len = len(points)
+        co = [0.0] * (old_len * 2)
+        if old_len: points.foreach_get("co", co)
+        merged = dict(zip(co[0::2], co[1::2]))
+        keys = {float(frame_start): value}
+        if frame_end is not None:
+            # Hold the previous value on both sides so frames outside the range keep their state
+            hold_frame = float(frame_start - 1); restore_frame = float(frame_end + 1)
+            for frame in (hold_frame, restore_frame):
+                keys[frame] = fcurve.evaluate(frame) >= 0.5 if old_len else bool(getattr(obj, data_path))
+            merged = {frame: v for frame, v in merged.items() if not frame_start <= frame <= restore_frame}
+        for frame, key_value in keys.items(): merged[frame] = 1.0 if key_value else 0.0
+        new_len = len(merged)
+        if new_len > old_len: points.add(new_len - old_len)
+        elif new_len < old_len: points.clear(); points.add(new_len)
+        flat = [v for frame in sorted(merged) for v in (frame, merged[frame])]
+        points.foreach_set("co", flat)
+        points.foreach_set("handle_left", flat); points.foreach_set("handle_right", flat)
+        points.foreach_set("interpolation", [0] * new_len) # 0 == 'CONSTANT', booleans must not blend
+        fcurve.update()
+        if frame_current is not None: setattr(obj, data_path, fcurve.evaluate(frame_current) >= 0.5) # Match the keyed state now
+        count += 1
+    return count
+
+
+# --- Object Index ---
+
+def get_object_index():
+    """name -> Object map built in one pass over bpy.data.objects, whose get() is a linear scan.
+    Build it once per operation and drop it afterwards: Object references must not outlive
+    deletes, undo or file loads."""
+    return {obj.name: obj for obj in bpy.data.objects}
+
+
+# --- Shared Data Index ---
+
+# data-block / instanced collection pointer -> {object pointer: object name}; object_keys holds each object's
+# current (data, collection, name). Names rather than Object references, so nothing stale is ever dereferenced.
+_users_index = {'key': None, 'data_users': {}, 'collection_users': {}, 'object_keys': {}}
+
+@persistent
+def users_index_reset(dummy):
+    # Pointers are not stable across load/undo/redo
+    _users_index['key'] = None
+
+def _index_object_users(obj):
+    index = _users_index; obj_key = obj.as_pointer()
+    data = obj.data; collection = _instanced_collection(obj)
+    keys = (data.as_pointer() if data else None, collection.as_pointer() if collection else None, obj.name)
+    old_keys = index['object_keys'].get(obj_key)
+    if old_keys == keys: return # Transform-only updates end here
+    for table, old_key in zip((index['data_users'], index['collection_users']), old_keys or (None, None)):
+        if old_key is not None and old_key in table:
+            table[old_key].pop(obj_key, None)
+            if not table[old_key]: del table[old_key]
+    for table, key in zip((index['data_users'], index['collection_users']), keys):
+        if key is not None: table.setdefault(key, {})[obj_key] = obj.name
+    index['object_keys'][obj_key] = keys
+
+def get_users_index():
+    """Reverse index of object data and instanced collections to their user objects. Built once,
+    then kept current (including renames) by users_index_depsgraph_update; rebuilt when objects were removed."""
+    index = _users_index
+    if index['key'] != len(bpy.data.objects):
+        index['data_users'] = {}; index['collection_users'] = {}; index['object_keys'] = {}
+        for obj in bpy.data.objects: _index_object_users(obj)
+        index['key'] = len(bpy.data.objects)
+    return index
+
+def _instanced_collection(obj):
+    return obj.instance_collection if obj.instance_type == 'COLLECTION' else None
+
+def get_shared_user_names(obj, target='DATA', object_index=None):
+    """Names of objects sharing obj's data ('DATA') or instancing the same collection ('INSTANCES'), one lookup.
+    Candidates are checked against object_index, since objects outside the evaluated scene never send updates."""
+    index = get_users_index(); object_index = get_object_index() if object_index is None else object_index
+    if target == 'DATA':
+        data = obj.data
+        if not data: return []
+        candidates = index['data_users'].get(data.as_pointer(), {}).values()
+        return [name for name in candidates if name in object_index and object_index[name].data == data]
+    collection = _instanced_collection(obj)
+    if not collection: return []
+    candidates = index['collection_users'].get(collection.as_pointer(), {}).values()
+    return [name for name in candidates if name in object_index and _instanced_collection(object_index[name]) == collection]
+
+@persistent
+def users_index_depsgraph_update(scene, depsgraph):
+    index = _users_index
+    if index['key'] is None or not depsgraph.id_type_updated('OBJECT'): return # Not built yet or nothing relevant
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object): _index_object_users(update.id.original)
+    # New and renamed objects arrive as updates; removals leave stale entries, so fall back to a lazy rebuild
+    index['key'] = len(bpy.data.objects) if len(index['object_keys']) == len(bpy.data.objects) else None
+
+
+# --- List Report ---
+
+_last_report = {} # scene name -> last computed report, drawn by the report panel
+REPORT_COUNT_KEYS = ("missing", "duplicated", "hidden", "render_disabled", "linked")
+
+def compute_list_report(context):
+    """List health in one pass over the list entries, resolved through a freshly built object index."""
+    scene = context.scene; view_layer = context.view_layer
+    report = {key: [] for key in REPORT_COUNT_KEYS}
+    seen = set(); blank = 0; object_index = get_object_index()
+    names = get_list_names(scene)
+    for name in names:
+        if not name: blank += 1; continue
+        if name in seen: report["duplicated"].append(name); continue
+        seen.add(name)
+        obj = object_index.get(name)
+        if obj is None: report["missing"].append(name); continue
+        if obj.library or obj.override_library: report["linked"].append(name)
+        try: hidden = obj.hide_viewport or obj.hide_get(view_layer=view_layer)
+        except RuntimeError: hidden = True # Not in this view layer
+        if hidden: report["hidden"].append(name)
+        if obj.hide_render: report["render_disabled"].append(name)
+
+    # Isolated away: visible when the isolation snapshot was taken, hidden now
+    isolate_mode = 'NONE'; isolated_away = 0
+    for mode, prop_name in (('LIST', "ovm_isolate_list_state"), ('SELECTION', "ovm_isolate_selection_state")):
+        state_collection = getattr(scene, prop_name)
+        if not state_collection: continue
+        isolate_mode = mode
+        was_hidden = [False] * len(state_collection); state_collection.foreach_get("hidden", was_hidden)
+        for name, hidden_before in zip(state_collection.keys(), was_hidden):
+            if hidden_before: continue
+            obj = object_index.get(name)
+            try:
+                if obj and obj.hide_get(view_layer=view_layer): isolated_away += 1
+            except RuntimeError: pass
+        break
+
+    summary = {key: len(report[key]) for key in REPORT_COUNT_KEYS}
+    summary.update(entries=len(names), blank=blank, isolate_mode=isolate_mode, isolated_away=isolated_away, scene_objects=len(bpy.data.objects))
+    report = {"scene": scene.name, "summary": summary, **report}
+    _last_report[scene.name] = report
+    return report
+
+def write_list_report(report, path, file_format='JSON'):
+    if file_format == 'CSV':
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(("section", "key", "value"))
+            for key, value in report["summary"].items(): writer.writerow(("summary", key, value))
+            for key in REPORT_COUNT_KEYS:
+                for name in report[key]: writer.writerow((key, name, ""))
+    else:
+        with open(path, 'w', encoding='utf-8') as f: json.dump(report, f, indent=2)
+
+@persistent
+def list_report_load_post(dummy):
+    # Reports belong to the previous file's scenes, which may share names with the new ones
+    _last_report.clear()
+
+@persistent
+def list_report_save_post(dummy):
+    prefs = get_addon_preferences()
+    if not prefs or not prefs.enable_report_on_save or not bpy.data.filepath: return
+    path = os.path.splitext(bpy.data.filepath)[0] + "_sceneflow_report.json"
+    try: write_list_report(compute_list_report(bpy.context), path)
+    except Exception as e: print(f"SceneFlow Report on save failed: {e}")
+
+
 # --- UI List ---
 
 class OBJECT_UL_ovm_object_name_list(bpy.types.UIList): # Renamed class
@@ -125,8 +579,8 @@ class AddBlankListItemOperator(bpy.types.Operator):
     # ...(Same as version 1.3)...
     bl_label = "Add Empty Item to List"; bl_description = "Add a new empty slot to the object name list"; bl_options = {'REGISTER', 'UNDO'}
     def execute(self, context):
-        item = context.scene.ovm_object_name_list.add(); item.name = "";
-        context.scene.ovm_active_object_name_index = len(context.scene.ovm_object_name_list) - 1
+        add_list_items(context.scene, [""])
+        set_active_list_index(context.scene, len(context.scene.ovm_object_name_list) - 1)
         auto_export_list_names(context); return {'FINISHED'}
 
 class RemoveActiveListItemOperator(bpy.types.Operator):
@@ -138,9 +592,9 @@ class RemoveActiveListItemOperator(bpy.types.Operator):
     def execute(self, context):
         idx = context.scene.ovm_active_object_name_index
         if 0 <= idx < len(context.scene.ovm_object_name_list):
-            context.scene.ovm_object_name_list.remove(idx)
+            remove_list_indices(context.scene, [idx])
             current_len = len(context.scene.ovm_object_name_list)
-            context.scene.ovm_active_object_name_index = min(idx, max(0, current_len - 1)) if current_len > 0 else -1
+            set_active_list_index(context.scene, min(idx, max(0, current_len - 1)) if current_len > 0 else -1)
             auto_export_list_names(context); return {'FINISHED'}
         else: self.report({'WARNING'}, "No item selected in the list to remove"); return {'CANCELLED'}
 
@@ -252,27 +706,46 @@ class AddSelectedToListOperator(bpy.types.Operator):
     # ...(Same as version 1.3)...
     bl_label = "Add Selected to List"; bl_description = "Add currently selected objects to the list"; bl_options = {'REGISTER', 'UNDO'}
     def execute(self, context):
-        count = 0; current_names = {item.name for item in context.scene.ovm_object_name_list}
-        for obj in context.selected_objects:
-            if obj.name not in current_names:
-                item = context.scene.ovm_object_name_list.add(); item.name = obj.name; count += 1
+        count = len(append_list_names(context.scene, [obj.name for obj in context.selected_objects]))
         if count > 0: auto_export_list_names(context); self.report({'INFO'}, f"Added {count} selected objects to list.")
         else: self.report({'INFO'}, "No new objects added (already in list or none selected).")
         return {'FINISHED'}
 
+class ExpandListToSharedUsersOperator(bpy.types.Operator):
+    bl_idname = "object.ovm_expand_shared"
+    bl_label = "Expand List to Shared Users"; bl_description = "Add every object sharing data with, or instancing the same collection as, the listed objects"; bl_options = {'REGISTER', 'UNDO'}
+    target: EnumProperty(name="Expand To", items=[
+        ('DATA', "Shared Data", "Objects using the same mesh/curve/... data (linked duplicates)"),
+        ('INSTANCES', "Collection Instances", "Objects instancing the same collection")])
+    only_active: BoolProperty(name="Active Entry Only", description="Expand only the active list entry", default=False)
+    @classmethod
+    def poll(cls, context): return len(context.scene.ovm_object_name_list) > 0
+    def execute(self, context):
+        scene = context.scene
+        if self.only_active:
+            idx = scene.ovm_active_object_name_index
+            if not 0 <= idx < len(scene.ovm_object_name_list): self.report({'WARNING'}, "No active list entry."); return {'CANCELLED'}
+            names = [scene.ovm_object_name_list[idx].name]
+        else: names = get_list_names(scene)
+        user_names = {}; object_index = get_object_index()
+        for name in dict.fromkeys(names):
+            obj = object_index.get(name) if name else None
+            if obj:
+                for user_name in get_shared_user_names(obj, self.target, object_index): user_names[user_name] = None
+        count = len(append_list_names(scene, user_names))
+        if count > 0: auto_export_list_names(context); self.report({'INFO'}, f"Added {count} objects sharing {'data' if self.target == 'DATA' else 'a collection'} with listed objects.")
+        else: self.report({'INFO'}, "No new objects added (no other users found).")
+        return {'FINISHED'}
+
 class RemoveSelectedFromListOperator(bpy.types.Operator):
     bl_idname = "object.ovm_remove_selected"
     # ...(Same as version 1.3)...
     bl_label = "Remove Selected from List"; bl_description = "Remove currently selected objects from the list"; bl_options = {'REGISTER', 'UNDO'}
     def execute(self, context):
         selected_names = {obj.name for obj in context.selected_objects}
-        indices_to_remove = [i for i, item in enumerate(context.scene.ovm_object_name_list) if item.name in selected_names]
-        if not indices_to_remove: self.report({'INFO'}, "No selected objects found in the list."); return {'CANCELLED'}
-        count = 0
-        for i in reversed(indices_to_remove): context.scene.ovm_object_name_list.remove(i); count += 1
+        count = remove_list_names(context.scene, selected_names)
+        if not count: self.report({'INFO'}, "No selected objects found in the list."); return {'CANCELLED'}
         if count > 0:
-            current_len = len(context.scene.ovm_object_name_list)
-            context.scene.ovm_active_object_name_index = min(context.scene.ovm_active_object_name_index, max(0, current_len - 1)) if current_len > 0 else -1
             auto_export_list_names(context); self.report({'INFO'}, f"Removed {count} objects from list based on selection.")
         return {'FINISHED'}
 
@@ -287,10 +760,8 @@ class AddManualNameOperator(bpy.types.Operator):
     def execute(self, context):
         name = self.name_to_add.strip();
         if not name: self.report({'WARNING'}, "Cannot add empty name."); return {'CANCELLED'}
-        current_names = {item.name for item in context.scene.ovm_object_name_list}
-        if name in current_names: self.report({'INFO'}, f"Name '{name}' is already in the list."); return {'CANCELLED'}
-        item = context.scene.ovm_object_name_list.add(); item.name = name
-        context.scene.ovm_active_object_name_index = len(context.scene.ovm_object_name_list) - 1
+        if not append_list_names(context.scene, [name]): self.report({'INFO'}, f"Name '{name}' is already in the list."); return {'CANCELLED'}
+        set_active_list_index(context.scene, len(context.scene.ovm_object_name_list) - 1)
         context.scene.ovm_object_name_input = ""; auto_export_list_names(context); self.report({'INFO'}, f"Added '{name}' to list.")
         return {'FINISHED'}
 
@@ -303,13 +774,9 @@ class RemoveManualNameOperator(bpy.types.Operator):
     def execute(self, context):
         name = self.name_to_remove.strip();
         if not name: self.report({'WARNING'}, "Cannot remove empty name."); return {'CANCELLED'}
-        found_index = -1
-        for i, item in enumerate(context.scene.ovm_object_name_list):
-            if item.name == name: found_index = i; break
-        if found_index != -1:
-            context.scene.ovm_object_name_list.remove(found_index)
-            current_len = len(context.scene.ovm_object_name_list)
-            context.scene.ovm_active_object_name_index = min(context.scene.ovm_active_object_name_index, max(0, current_len - 1)) if current_len > 0 else -1
+        names = get_list_names(context.scene)
+        if name in names:
+            remove_list_indices(context.scene, [names.index(name)]) # First match only, as before
             context.scene.ovm_object_name_input = ""; auto_export_list_names(context); self.report({'INFO'}, f"Removed '{name}' from list.")
             return {'FINISHED'}
         else: self.report({'INFO'}, f"Name '{name}' not found in the list."); return {'CANCELLED'}
@@ -322,8 +789,8 @@ class RemoveAllNamesOperator(bpy.types.Operator):
     def poll(cls, context): return len(context.scene.ovm_object_name_list) > 0
     def execute(self, context):
         if not context.scene.ovm_object_name_list: return {'CANCELLED'}
-        count = len(context.scene.ovm_object_name_list); context.scene.ovm_object_name_list.clear();
-        context.scene.ovm_active_object_name_index = -1; auto_export_list_names(context); self.report({'INFO'}, f"Cleared {count} names from the list.")
+        count = len(context.scene.ovm_object_name_list); set_list_names(context.scene, [])
+        set_active_list_index(context.scene, -1); auto_export_list_names(context); self.report({'INFO'}, f"Cleared {count} names from the list.")
         return {'FINISHED'}
 
 class ImportNamesFromFileOperator(bpy.types.Operator, ImportHelper):
@@ -332,13 +799,10 @@ class ImportNamesFromFileOperator(bpy.types.Operator, ImportHelper):
     bl_label = "Import Names from .txt"; bl_description = "Add names from a text file (one name per line)"; bl_options = {'REGISTER', 'UNDO'}
     filter_glob: StringProperty(default="*.txt", options={'HIDDEN'}); filename_ext = ".txt"
     def execute(self, context):
-        count = 0; current_names = {item.name for item in context.scene.ovm_object_name_list}
         try:
             with open(self.filepath, 'r', encoding='utf-8') as f:
-                for line in f:
-                    name = line.strip()
-                    if name and name not in current_names:
-                        item = context.scene.ovm_object_name_list.add(); item.name = name; current_names.add(name); count += 1
+                file_names = [name for name in (line.strip() for line in f) if name]
+            count = len(append_list_names(context.scene, file_names))
             if count > 0: auto_export_list_names(context); self.report({'INFO'}, f"Imported {count} new names from {self.filepath}")
             else: self.report({'INFO'}, "No new names imported (empty file or names already exist).")
         except Exception as e: self.report({'ERROR'}, f"Import failed: {e}"); return {'CANCELLED'}
@@ -358,6 +822,7 @@ class ExportNamesToFileOperator(bpy.types.Operator, ExportHelper):
             with open(self.filepath, 'w', encoding='utf-8') as f:
                 for item in context.scene.ovm_object_name_list: f.write(item.name + "\n")
             if prefs: prefs.last_export_path = self.filepath
+            sync_list_watch(bpy.path.abspath(self.filepath))
             self.report({'INFO'}, f"Exported {count} names to {self.filepath}")
         except Exception as e: self.report({'ERROR'}, f"Export failed: {e}"); return {'CANCELLED'}
         return {'FINISHED'}
@@ -397,6 +862,40 @@ class UnhideListObjectsOperator(bpy.types.Operator):
         self.report({'INFO'}, f"Unhid {count} objects found in the list.")
         return {'FINISHED'}
 
+class SetListObjectFlagOperator(bpy.types.Operator):
+    bl_idname = "object.ovm_set_list_flag"
+    bl_label = "Set Render/Viewport Flag on List"; bl_description = "Disable or enable render/viewport for objects in the list, optionally keyframed"; bl_options = {'REGISTER', 'UNDO'}
+    flag: EnumProperty(name="Flag", items=[
+        ('hide_render', "Render", "Disable in renders (hide_render)"),
+        ('hide_viewport', "Viewport", "Disable in viewports (hide_viewport)")])
+    disable: BoolProperty(name="Disable", default=True)
+    use_keyframes: BoolProperty(name="Keyframe", description="Key the flag instead of only setting it", default=False)
+    use_frame_range: BoolProperty(name="Frame Range", description="Key the flag at Start and restore each object's previous value after End", default=False)
+    frame_start: IntProperty(name="Start")
+    frame_end: IntProperty(name="End")
+    @classmethod
+    def poll(cls, context): return len(context.scene.ovm_object_name_list) > 0
+    def invoke(self, context, event):
+        if not self.properties.is_property_set("frame_start"): self.frame_start = context.scene.frame_current
+        if not self.properties.is_property_set("frame_end"): self.frame_end = context.scene.frame_end
+        return self.execute(context)
+    def execute(self, context):
+        scene = context.scene; object_index = get_object_index()
+        objects = [obj for obj in (object_index.get(name) for name in dict.fromkeys(get_list_names(scene)) if name) if obj]
+        if not objects: self.report({'INFO'}, "No objects from the list found in the scene."); return {'CANCELLED'}
+        label = "render" if self.flag == 'hide_render' else "viewport"; action = "Disabled" if self.disable else "Enabled"
+        if not self.use_keyframes:
+            for obj in objects: setattr(obj, self.flag, self.disable)
+            self.report({'INFO'}, f"{action} {label} for {len(objects)} objects in the list."); return {'FINISHED'}
+        if self.use_frame_range:
+            if self.frame_end < self.frame_start: self.report({'WARNING'}, "End frame is before start frame."); return {'CANCELLED'}
+            count = key_object_flag(objects, self.flag, self.disable, self.frame_start, self.frame_end, scene.frame_current)
+            self.report({'INFO'}, f"{action} {label} for {count} objects in the list on frames {self.frame_start}-{self.frame_end}.")
+        else:
+            count = key_object_flag(objects, self.flag, self.disable, scene.frame_current, frame_current=scene.frame_current)
+            self.report({'INFO'}, f"{action} {label} for {count} objects in the list (keyed on frame {scene.frame_current}).")
+        return {'FINISHED'}
+
 class DeleteListObjectsOperator(bpy.types.Operator):
     bl_idname = "object.ovm_delete_list"
     # ...(Same as version 1.3)...
@@ -416,14 +915,36 @@ class DeleteListObjectsOperator(bpy.types.Operator):
         bpy.ops.object.select_all(action='DESELECT');
         for obj in objects_to_delete: obj.select_set(True)
         bpy.ops.object.delete(use_global=False, confirm=False)
-        indices_to_remove = [i for i, item in enumerate(context.scene.ovm_object_name_list) if item.name in deleted_names]
-        if indices_to_remove:
-            for i in reversed(indices_to_remove): context.scene.ovm_object_name_list.remove(i)
-            current_len = len(context.scene.ovm_object_name_list)
-            context.scene.ovm_active_object_name_index = min(context.scene.ovm_active_object_name_index, max(0, current_len - 1)) if current_len > 0 else -1
+        remove_list_names(context.scene, deleted_names)
         self.report({'INFO'}, f"Deleted {count} objects found in the list."); auto_export_list_names(context)
         return {'FINISHED'}
 
+# --- Report Operators ---
+class RefreshListReportOperator(bpy.types.Operator):
+    bl_idname = "object.ovm_refresh_report"
+    bl_label = "Refresh List Report"; bl_description = "Recompute list health statistics (missing, duplicated, hidden, linked, isolated)"; bl_options = {'REGISTER'}
+    def execute(self, context):
+        summary = compute_list_report(context)["summary"]
+        self.report({'INFO'}, f"List report: {summary['entries']} entries, {summary['missing']} missing, {summary['duplicated']} duplicated, {summary['hidden']} hidden.")
+        return {'FINISHED'}
+
+class ExportListReportOperator(bpy.types.Operator, ExportHelper):
+    bl_idname = "object.ovm_export_report"
+    bl_label = "Export List Report"; bl_description = "Compute the list report and save it as JSON or CSV"; bl_options = {'PRESET'}
+    filename_ext = ".json"; filter_glob: StringProperty(default="*.json;*.csv", options={'HIDDEN'})
+    file_format: EnumProperty(name="Format", items=[('JSON', "JSON", "Summary plus name lists"), ('CSV', "CSV", "section,key,value rows")])
+    def check(self, context):
+        self.filename_ext = ".csv" if self.file_format == 'CSV' else ".json"
+        return super().check(context)
+    def execute(self, context):
+        ext = ".csv" if self.file_format == 'CSV' else ".json"
+        path = self.filepath if self.filepath.lower().endswith(ext) else os.path.splitext(self.filepath)[0] + ext
+        try:
+            write_list_report(compute_list_report(context), path, self.file_format)
+            self.report({'INFO'}, f"Exported list report to {path}")
+        except Exception as e: self.report({'ERROR'}, f"Report export failed: {e}"); return {'CANCELLED'}
+        return {'FINISHED'}
+
 # === Operators: Viewport Selection ===
 class HideSelectedObjectsOperator(bpy.types.Operator):
     bl_idname = "object.ovm_hide_selected"
@@ -474,12 +995,8 @@ class DeleteSelectedObjectsOperator(bpy.types.Operator):
         selected_names = {obj.name for obj in context.selected_objects}; count = len(selected_names)
         # if context.mode != 'OBJECT': bpy.ops.object.mode_set(mode='OBJECT') # Delete op handles mode
         bpy.ops.object.delete(use_global=False, confirm=False)
-        indices_to_remove = [i for i, item in enumerate(context.scene.ovm_object_name_list) if item.name in selected_names]
-        if indices_to_remove:
-            removed_from_list_count = 0
-            for i in reversed(indices_to_remove): context.scene.ovm_object_name_list.remove(i); removed_from_list_count += 1
-            current_len = len(context.scene.ovm_object_name_list)
-            context.scene.ovm_active_object_name_index = min(context.scene.ovm_active_object_name_index, max(0, current_len - 1)) if current_len > 0 else -1
+        removed_from_list_count = remove_list_names(context.scene, selected_names)
+        if removed_from_list_count:
             self.report({'INFO'}, f"Deleted {count} selected objects (removed {removed_from_list_count} from SceneFlow list)."); auto_export_list_names(context)
         else: self.report({'INFO'}, f"Deleted {count} selected objects.")
         return {'FINISHED'}
@@ -519,6 +1036,11 @@ class OBJECT_PT_SceneFlow_ListControls(bpy.types.Panel):
         row_select.operator(AddSelectedToListOperator.bl_idname, text="Add Selected", icon='PLUS')
         row_select.operator(RemoveSelectedFromListOperator.bl_idname, text="Remove Selected", icon='REMOVE')
 
+        # Expand via shared data / collection instances
+        row_expand = col_list_mgmt.row(align=True)
+        row_expand.operator(ExpandListToSharedUsersOperator.bl_idname, text="Add Data Users", icon='MESH_DATA').target = 'DATA'
+        row_expand.operator(ExpandListToSharedUsersOperator.bl_idname, text="Add Instances", icon='OUTLINER_OB_GROUP_INSTANCE').target = 'INSTANCES'
+
         col_list_mgmt.separator()
 
         # Main List UI with +/- buttons
@@ -538,6 +1060,10 @@ class OBJECT_PT_SceneFlow_ListControls(bpy.types.Panel):
         row_list_select_ops = col_list_select.row(align=True)
         row_list_select_ops.operator(SelectObjectsInListOperator.bl_idname, text="Select List Objs", icon='RESTRICT_SELECT_OFF')
         row_list_select_ops.operator(DeselectObjectsInListOperator.bl_idname, text="Deselect List Objs", icon='PANEL_CLOSE')
+        row_sync = col_list_select.row(align=True)
+        row_sync.prop(scene, "ovm_selection_sync", text="Live Sync", icon='UV_SYNC_SELECT')
+        sub_sync = row_sync.row(align=True); sub_sync.active = scene.ovm_selection_sync
+        sub_sync.prop(scene, "ovm_selection_sync_membership", text="")
 
 
         # --- File Operations For Text File ---
@@ -550,6 +1076,7 @@ class OBJECT_PT_SceneFlow_ListControls(bpy.types.Panel):
         prefs = get_addon_preferences()
         if prefs:
            col_file.prop(prefs, "enable_auto_export") # Keep it simple
+           col_file.prop(prefs, "enable_list_watch")
 
         # --- List-based Object Actions ---
         box_list_actions = layout.box()
@@ -559,6 +1086,13 @@ class OBJECT_PT_SceneFlow_ListControls(bpy.types.Panel):
         row_list_vis.operator(HideListObjectsOperator.bl_idname, text="Hide", icon='HIDE_ON')
         row_list_vis.operator(UnhideListObjectsOperator.bl_idname, text="Unhide", icon='HIDE_OFF')
 
+        row_list_flags = col_list_actions.row(align=True)
+        for flag, icon_off, icon_on in (('hide_render', 'RESTRICT_RENDER_ON', 'RESTRICT_RENDER_OFF'), ('hide_viewport', 'RESTRICT_VIEW_ON', 'RESTRICT_VIEW_OFF')):
+            for disable, icon in ((True, icon_off), (False, icon_on)):
+                op = row_list_flags.operator(SetListObjectFlagOperator.bl_idname, text="", icon=icon)
+                op.flag = flag; op.disable = disable; op.use_keyframes = scene.ovm_key_object_flags
+        row_list_flags.prop(scene, "ovm_key_object_flags", text="", icon='KEY_HLT' if scene.ovm_key_object_flags else 'KEY_DEHLT')
+
         row_list_iso = col_list_actions.row(align=True)
         op_list_iso = row_list_iso.operator(IsolateRestoreListOperator.bl_idname, text="Isolate / Restore", icon='SELECT_SUBTRACT')
         row_list_iso.operator(UnhideAllObjectsOperator.bl_idname, text="Unhide All", icon='RESTRICT_VIEW_OFF') # Changed icon for clarity
@@ -592,13 +1126,42 @@ class OBJECT_PT_SceneFlow_SelectedControls(bpy.types.Panel):
         col.operator(DeleteSelectedObjectsOperator.bl_idname, text="Delete Selected", icon='TRASH')
 
 
+class OBJECT_PT_SceneFlow_Report(bpy.types.Panel):
+    bl_label = "SceneFlow - List Report"
+    bl_idname = "OBJECT_PT_ovm_list_report"
+    bl_space_type = 'VIEW_3D'; bl_region_type = 'UI'; bl_category = "SceneFlow"; bl_order = 3
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        row = layout.row(align=True)
+        row.operator(RefreshListReportOperator.bl_idname, text="Refresh", icon='FILE_REFRESH')
+        row.operator(ExportListReportOperator.bl_idname, text="Export", icon='EXPORT')
+
+        report = _last_report.get(context.scene.name)
+        if not report:
+            layout.label(text="No report yet.", icon='INFO'); return
+        summary = report["summary"]
+        col = layout.box().column(align=True)
+        col.label(text=f"List Entries: {summary['entries']} ({summary['blank']} blank)")
+        col.label(text=f"Missing from Scene: {summary['missing']}", icon='ERROR' if summary['missing'] else 'CHECKMARK')
+        col.label(text=f"Duplicated: {summary['duplicated']}")
+        col.label(text=f"Hidden: {summary['hidden']}")
+        col.label(text=f"Render Disabled: {summary['render_disabled']}")
+        col.label(text=f"Linked from Libraries: {summary['linked']}")
+        if summary['isolate_mode'] != 'NONE':
+            col.label(text=f"Isolated Away ({summary['isolate_mode'].title()}): {summary['isolated_away']}")
+        prefs = get_addon_preferences()
+        if prefs: layout.prop(prefs, "enable_report_on_save")
+
+
 class OBJECT_PT_SceneFlow_About(bpy.types.Panel):
     bl_label = "About SceneFlow"
     bl_idname = "OBJECT_PT_sceneflow_about"
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
     bl_category = "SceneFlow"
-    bl_order = 3
+    bl_order = 4
 
     def draw(self, context):
         layout = self.layout
@@ -639,16 +1202,18 @@ classes = (
     IsolateRestoreListOperator, IsolateRestoreSelectedOperator,
     UnhideAllObjectsOperator,
     AddSelectedToListOperator, # Restored
+    ExpandListToSharedUsersOperator,
     RemoveSelectedFromListOperator, # Restored
     AddManualNameOperator, RemoveManualNameOperator,
     RemoveAllNamesOperator,
     ImportNamesFromFileOperator, ExportNamesToFileOperator,
-    HideListObjectsOperator, UnhideListObjectsOperator, DeleteListObjectsOperator,
+    HideListObjectsOperator, UnhideListObjectsOperator, SetListObjectFlagOperator, DeleteListObjectsOperator,
     HideSelectedObjectsOperator, UnhideSelectedObjectsOperator, DeleteSelectedObjectsOperator,
+    RefreshListReportOperator, ExportListReportOperator,
 
     # Panels
     OBJECT_PT_SceneFlow_ActionControls, OBJECT_PT_SceneFlow_ListControls,
-    OBJECT_PT_SceneFlow_SelectedControls, OBJECT_PT_SceneFlow_About,
+    OBJECT_PT_SceneFlow_SelectedControls, OBJECT_PT_SceneFlow_Report, OBJECT_PT_SceneFlow_About,
 )
 
 def register():
@@ -657,18 +1222,62 @@ def register():
 
     # Scene properties (using ovm_ prefix)
     bpy.types.Scene.ovm_object_name_list = CollectionProperty(type=ObjectNameProperty)
-    bpy.types.Scene.ovm_active_object_name_index = IntProperty(name="Active SceneFlow Name Index", default=-1, min=-1)
+    bpy.types.Scene.ovm_active_object_name_index = IntProperty(name="Active SceneFlow Name Index", default=-1, min=-1, update=on_active_list_index_changed)
     bpy.types.Scene.ovm_object_name_input = StringProperty(name="Manual Object Name", description="Name to add/remove manually")
     bpy.types.Scene.ovm_isolate_list_state = CollectionProperty(type=SceneFlow_VisibilityStateItem)
     bpy.types.Scene.ovm_isolate_selection_state = CollectionProperty(type=SceneFlow_VisibilityStateItem)
+    bpy.types.Scene.ovm_selection_sync = BoolProperty(
+        name="Live Selection Sync", default=False, update=on_selection_sync_toggled,
+        description="Keep the viewport selection and the list highlight in step")
+    bpy.types.Scene.ovm_selection_sync_membership = EnumProperty(
+        name="Sync Membership", default='NONE',
+        description="How viewport selection changes affect list membership",
+        items=[('NONE', "Highlight Only", "Only move the list highlight to the active object"),
+               ('ADD', "Add Selected", "Append newly selected objects to the list"),
+               ('MIRROR', "Mirror Selection", "Append newly selected objects and remove deselected ones")])
+    bpy.types.Scene.ovm_key_object_flags = BoolProperty(
+        name="Keyframe Flags", default=False,
+        description="Render/viewport list buttons insert keyframes (adjust the frame range in the redo panel)")
+    subscribe_selection_sync()
+    if selection_sync_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(selection_sync_load_post)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if users_index_reset not in handlers: handlers.append(users_index_reset)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if selection_sync_undo_post not in handlers: handlers.append(selection_sync_undo_post)
+    if list_report_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(list_report_load_post)
+    if list_report_save_post not in bpy.app.handlers.save_post:
+        bpy.app.handlers.save_post.append(list_report_save_post)
+    for handler in (selection_sync_depsgraph_update, users_index_depsgraph_update):
+        if handler not in bpy.app.handlers.depsgraph_update_post: bpy.app.handlers.depsgraph_update_post.append(handler)
+    if not bpy.app.timers.is_registered(list_watch_timer):
+        bpy.app.timers.register(list_watch_timer, first_interval=LIST_WATCH_IDLE_INTERVAL, persistent=True)
     print("SceneFlow Addon Registered (v1.4)")
 
 
 def unregister():
+    if bpy.app.timers.is_registered(list_watch_timer):
+        bpy.app.timers.unregister(list_watch_timer)
+    bpy.msgbus.clear_by_owner(_selection_sync_owner)
+    if selection_sync_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(selection_sync_load_post)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if users_index_reset in handlers: handlers.remove(users_index_reset)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if selection_sync_undo_post in handlers: handlers.remove(selection_sync_undo_post)
+    if list_report_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(list_report_load_post)
+    if list_report_save_post in bpy.app.handlers.save_post:
+        bpy.app.handlers.save_post.remove(list_report_save_post)
+    for handler in (selection_sync_depsgraph_update, users_index_depsgraph_update):
+        if handler in bpy.app.handlers.depsgraph_update_post: bpy.app.handlers.depsgraph_update_post.remove(handler)
+
     # Delete scene properties first (use correct names)
     prop_names = [
         "ovm_object_name_list", "ovm_active_object_name_index", "ovm_object_name_input",
-        "ovm_isolate_list_state", "ovm_isolate_selection_state"
+        "ovm_isolate_list_state", "ovm_isolate_selection_state",
+        "ovm_selection_sync", "ovm_selection_sync_membership", "ovm_key_object_flags"
     ]
     for prop_name in prop_names:
         if hasattr(bpy.types.Scene, prop_name):
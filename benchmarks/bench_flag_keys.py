@@ -0,0 +1,73 @@
+# bench_flag_keys.py
+# Compares SceneFlow's bulk flag keying (keyframe_points.add + foreach_set per F-curve) with one
+# keyframe_insert per object and key, writing the same hold/start/restore keys for a frame range.
+# Run from the repository root:
+#   blender --background --factory-startup --python benchmarks/bench_flag_keys.py
+#
+# Blender 5.0.1 (bpy module, Python 3.11), hold/start/restore keys per object, two runs with either order first:
+#    objects case     keyframe_insert (s)   bulk (s)  speedup
+#       1000 new                   0.0770     0.0735  1.0-1.2x
+#       1000 rekey                 0.0176     0.0232  0.8-1.0x
+#      10000 new                   1.0000     0.8835  1.1-1.3x
+#      10000 rekey                 0.2249     0.2613  0.9-1.2x
+# With three keys per object, creating the action/slot dominates both paths, so bulk writes are at parity.
+
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import SceneFlow
+from SceneFlow import sceneflow
+
+SIZES = (1_000, 10_000)
+FRAME_START, FRAME_END = 10, 50
+
+
+def make_objects(scene, prefix, count):
+    objects = [bpy.data.objects.new(f"{prefix}.{i:06d}", None) for i in range(count)]
+    for obj in objects: scene.collection.objects.link(obj)
+    return objects
+
+def remove_objects(objects):
+    for obj in objects:
+        action = obj.animation_data.action if obj.animation_data else None
+        bpy.data.objects.remove(obj)
+        if action: bpy.data.actions.remove(action)
+
+
+def key_per_object(objects, data_path, value):
+    for obj in objects:
+        previous = getattr(obj, data_path)
+        obj.keyframe_insert(data_path, frame=FRAME_START - 1)
+        setattr(obj, data_path, value); obj.keyframe_insert(data_path, frame=FRAME_START)
+        setattr(obj, data_path, previous); obj.keyframe_insert(data_path, frame=FRAME_END + 1)
+
+def key_bulk(objects, data_path, value):
+    sceneflow.key_object_flag(objects, data_path, value, FRAME_START, FRAME_END)
+
+
+def main():
+    SceneFlow.register()
+    try:
+        scene = bpy.context.scene
+        print(f"{'objects':>8} {'case':<7} {'keyframe_insert (s)':>20} {'bulk (s)':>10} {'speedup':>8}")
+        for size in SIZES:
+            timings = {}
+            for prefix, fn in (("PerObject", key_per_object), ("Bulk", key_bulk)):
+                objects = make_objects(scene, prefix, size)
+                start = time.perf_counter(); fn(objects, "hide_render", True); first = time.perf_counter() - start
+                start = time.perf_counter(); fn(objects, "hide_render", False); again = time.perf_counter() - start # Curves exist now
+                timings[prefix] = (first, again)
+                remove_objects(objects)
+            for i, case in enumerate(("new", "rekey")):
+                per_object, bulk = timings["PerObject"][i], timings["Bulk"][i]
+                print(f"{size:>8} {case:<7} {per_object:>20.4f} {bulk:>10.4f} {per_object / max(bulk, 1e-9):>7.1f}x")
+    finally:
+        SceneFlow.unregister()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# bench_list_rebuild.py
+# Compares the per-item list path (add() + .name / remove(i)) with SceneFlow's bulk list primitive.
+# Run from the repository root:
+#   blender --background --factory-startup --python benchmarks/bench_list_rebuild.py
+#
+# Blender 5.0.1 (bpy module, Python 3.11), best of 3:
+#  entries case      per-item (s)   bulk (s)  speedup
+#    10000 fill            0.0199     0.0146     1.4x
+#    10000 edit 1          0.0002     0.0263     0.0x
+#    10000 prune           0.5163     0.0144    35.9x
+#   100000 fill            0.2322     0.1486     1.6x
+#   100000 edit 1          0.0027     0.2834     0.0x
+#   100000 prune          64.7141     0.2080   311.1x
+# Single-entry edits stay in place (add()/remove(i)); rebuilds are for bulk changes (see SMALL_LIST_EDIT).
+
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import SceneFlow
+from SceneFlow import sceneflow
+
+SIZES = (10_000, 100_000)
+REPEATS = 3
+
+
+def best_of(fn):
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter(); fn(); elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def fill_per_item(scene, names):
+    name_list = scene.ovm_object_name_list
+    name_list.clear()
+    for name in names:
+        item = name_list.add(); item.name = name
+
+def fill_bulk(scene, names):
+    sceneflow.set_list_names(scene, names)
+
+def edit_per_item(scene, names):
+    sceneflow.add_list_items(scene, ["Extra"]); sceneflow.remove_list_indices(scene, [len(names)])
+
+def edit_bulk(scene, names):
+    sceneflow.set_list_names(scene, names + ["Extra"]); sceneflow.set_list_names(scene, names)
+
+def prune_per_item(scene, names, removed):
+    fill_bulk(scene, names)
+    name_list = scene.ovm_object_name_list
+    indices_to_remove = [i for i, item in enumerate(name_list) if item.name in removed]
+    for i in reversed(indices_to_remove): name_list.remove(i)
+
+def prune_bulk(scene, names, removed):
+    fill_bulk(scene, names)
+    sceneflow.remove_list_names(scene, removed)
+
+
+def main():
+    SceneFlow.register()
+    try:
+        scene = bpy.context.scene
+        print(f"{'entries':>8} {'case':<8} {'per-item (s)':>13} {'bulk (s)':>10} {'speedup':>8}")
+        for size in SIZES:
+            names = [f"Object.{i:06d}" for i in range(size)]
+            removed = set(names[::2]) # Prune every other entry
+            fill_bulk(scene, names); setup = best_of(lambda: fill_bulk(scene, names)) # Prune timings include a bulk refill
+            cases = (
+                ("fill", best_of(lambda: fill_per_item(scene, names)), best_of(lambda: fill_bulk(scene, names))),
+                ("edit 1", best_of(lambda: edit_per_item(scene, names)), best_of(lambda: edit_bulk(scene, names))),
+                ("prune", best_of(lambda: prune_per_item(scene, names, removed)) - setup, best_of(lambda: prune_bulk(scene, names, removed)) - setup),
+            )
+            for case, per_item, bulk in cases:
+                print(f"{size:>8} {case:<8} {per_item:>13.4f} {bulk:>10.4f} {per_item / max(bulk, 1e-9):>7.1f}x")
+            assert sceneflow.get_list_names(scene) == names[1::2]
+        sceneflow.set_list_names(scene, [])
+    finally:
+        SceneFlow.unregister()
+
+
+if __name__ == "__main__":
+    main()